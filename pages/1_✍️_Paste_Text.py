@@ -17,6 +17,11 @@ st.set_page_config(page_title="Paste Text", page_icon="✍️", layout="wide")
 
 # --- Helper Function ---
 def process_and_display(content: str, source_name: str):
+    # Duplicate content would be rejected by the ingestor anyway; skip the LLM round trip
+    if data_ingestor.source_exists(content):
+        st.warning("This text has already been processed.")
+        return
+
     normalized_content = normalize_text(content)
 
     with st.spinner("🤖 AI is analyzing..."):
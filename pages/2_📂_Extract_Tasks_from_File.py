@@ -19,6 +19,11 @@ st.set_page_config(page_title="Extract Tasks from File", page_icon="📂", layou
 
 # --- Helper Function ---
 def process_and_display(content: str, source_name: str):
+    # Duplicate content would be rejected by the ingestor anyway; skip the LLM round trip
+    if data_ingestor.source_exists(content):
+        st.warning("This file has already been processed.")
+        return
+
     normalized_content = normalize_text(content)
 
     with st.spinner("🤖 AI is analyzing and indexing..."):
@@ -1,6 +1,5 @@
 import streamlit as st
-import os
-import tempfile
+import io
 from task_assistant.services import initialize_services
 from task_assistant.jira_handler import process_jira_csv
 from task_assistant.logger_config import log
@@ -9,6 +8,7 @@ from task_assistant.logger_config import log
 initialize_services()
 db_handler = st.session_state.db_handler
 rules_engine = st.session_state.rules_engine
+data_ingestor = st.session_state.data_ingestor
 
 st.set_page_config(page_title="Jira Import", page_icon="🗂️", layout="wide")
 
@@ -21,19 +21,19 @@ jira_file = st.file_uploader("Choose a Jira CSV file", type=['csv'])
 if jira_file is not None:
     if st.button("🚀 Process Jira File"):
         with st.spinner("Processing Jira export..."):
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".csv") as tmp:
-                tmp.write(jira_file.getvalue())
-                tmp_path = tmp.name
+            # Parse the upload straight from memory instead of round-tripping it through a temp file
+            raw_bytes = jira_file.getvalue()
 
             try:
-                jira_tasks = process_jira_csv(tmp_path)
+                jira_tasks = process_jira_csv(io.BytesIO(raw_bytes))
                 if jira_tasks:
                     enriched_tasks = rules_engine.apply_priority(jira_tasks)
                     source_name = f"Jira Import - {jira_file.name}"
-                    file_content = jira_file.getvalue().decode('utf-8')
+                    file_content = raw_bytes.decode('utf-8')
 
-                    if not db_handler.check_source_exists(file_content):
-                        db_handler.insert_data(source_name, file_content, enriched_tasks)
+                    if not data_ingestor.source_exists(file_content):
+                        # Inserts the source and all of its tasks in a single transaction
+                        data_ingestor.ingest_data(source_name, file_content, enriched_tasks)
                         st.success(f"Successfully imported and saved {len(enriched_tasks)} action items!")
                     else:
                         st.warning("This Jira file has already been imported.")
@@ -42,5 +42,3 @@ if jira_file is not None:
             except Exception as e:
                 st.error(f"An error occurred while processing the Jira file: {e}")
                 log.error(f"Failed to process Jira file: {e}")
-            finally:
-                os.remove(tmp_path)
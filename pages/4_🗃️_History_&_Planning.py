@@ -29,6 +29,29 @@ def sanitize_df_for_streamlit(df: pd.DataFrame) -> pd.DataFrame:
     return df_copy
 
 
+@st.fragment
+def render_triage_row(task_id, task_description: str):
+    """
+    Renders one undated task with its date picker. As a fragment, picking a date
+    reruns only this row; saving reruns the whole page to refresh the lists.
+    """
+    col1, col2, col3 = st.columns([3, 1, 1])
+    with col1:
+        st.markdown(f"- {task_description}")
+    with col2:
+        new_date = st.date_input("Assign Due Date", key=f"date_assign_{task_id}", value=None)
+    with col3:
+        st.write("")
+        st.write("")
+        if st.button("Save Date", key=f"save_date_{task_id}"):
+            if new_date:
+                db_handler.update_action_item(task_id, {'due_date': new_date})
+                st.toast(f"Due date added for task {task_id}!")
+                st.rerun()
+            else:
+                st.warning("Please select a date first.")
+
+
 # --- Page Content ---
 st.subheader("Action Item History & Planning")
 st.info(
@@ -50,21 +73,7 @@ st.markdown("---")
 with st.expander(f"**🗓️ Triage Tasks without a Due Date ({len(tasks_without_due_date)})**", expanded=True):
     if not tasks_without_due_date.empty:
         for _, row in tasks_without_due_date.iterrows():
-            col1, col2, col3 = st.columns([3, 1, 1])
-            with col1:
-                st.markdown(f"- {row['task_description']}")
-            with col2:
-                new_date = st.date_input("Assign Due Date", key=f"date_assign_{row['id']}", value=None)
-            with col3:
-                st.write("")
-                st.write("")
-                if st.button("Save Date", key=f"save_date_{row['id']}"):
-                    if new_date:
-                        db_handler.update_action_item(row['id'], {'due_date': new_date})
-                        st.toast(f"Due date added for task {row['id']}!")
-                        st.rerun()
-                    else:
-                        st.warning("Please select a date first.")
+            render_triage_row(row['id'], row['task_description'])
     else:
         st.write("All tasks have been assigned a due date. Great job!")
 
@@ -81,16 +90,23 @@ st.divider()
 
 # --- THIS IS THE CORRECTED LOGIC ---
 
-# 1. Create a list of user-friendly strings for the dropdown options
-dependency_options = ["—"] + [f"Task {row['id']}: {row['task_description'][:50]}..." for _, row in full_df.iterrows()]
+# The dropdown options only change when the data does, so rebuild them once per data version.
+data_version = db_handler.get_data_version()
+dependency_cache = st.session_state.get("dependency_cache")
+if dependency_cache is None or dependency_cache[0] != data_version:
+    # 1. Create the user-friendly strings for the dropdown options in one vectorized pass
+    labels = ("Task " + full_df['id'].astype(str) + ": " + full_df['task_description'].str[:50] + "...").tolist()
+    dependency_options = ["—"] + labels
 
-# 2. Create a mapping from the friendly string back to the ID for saving
-desc_to_id_map = {"—": None}
-for _, row in full_df.iterrows():
-    desc_to_id_map[f"Task {row['id']}: {row['task_description'][:50]}..."] = row['id']
+    # 2. Create a mapping from the friendly string back to the ID for saving
+    desc_to_id_map = {"—": None, **dict(zip(labels, full_df['id'].tolist()))}
+
+    # 3. We need to pre-convert the 'depends_on_id' into the string format for display
+    id_to_desc_map = {v: k for k, v in desc_to_id_map.items()}
+    st.session_state.dependency_cache = (data_version, dependency_options, desc_to_id_map, id_to_desc_map)
+else:
+    _, dependency_options, desc_to_id_map, id_to_desc_map = dependency_cache
 
-# 3. We need to pre-convert the 'depends_on_id' into the string format for display
-id_to_desc_map = {v: k for k, v in desc_to_id_map.items()}
 display_df = filtered_df.copy()
 display_df['depends_on_id'] = display_df['depends_on_id'].map(id_to_desc_map).fillna("—")
 
@@ -117,17 +133,21 @@ if st.button("💾 Save Changes"):
     try:
         edited_rows = st.session_state["data_editor"].get("edited_rows", {})
         if edited_rows:
-            updates = []
+            updates = {}
+            # Positional row index -> task ID, built once rather than re-indexing the frame per edited row
+            row_ids = filtered_df['id'].tolist()
             for row_index, changed_data in edited_rows.items():
                 # Get the original ID from the unfiltered, original dataframe
-                original_id = filtered_df.reset_index(drop=True).iloc[row_index]['id']
+                original_id = row_ids[row_index]
 
                 # If the dependency was changed, convert the string back to an ID
                 if 'depends_on_id' in changed_data:
                     changed_data['depends_on_id'] = desc_to_id_map.get(changed_data['depends_on_id'])
 
-                db_handler.update_action_item(original_id, changed_data)
-                updates.append(original_id)
+                updates[original_id] = changed_data
+
+            # Write every edited row in one transaction instead of one commit per row
+            db_handler.update_action_items(updates)
 
             if updates:
                 st.toast(f"Updated {len(updates)} task(s).")
@@ -10,6 +10,15 @@ db_handler = st.session_state.db_handler
 
 st.set_page_config(page_title="Calendar", page_icon="🗓️", layout="wide")
 
+STATUS_OPTIONS = ["To Do", "In Progress", "Done", "Blocked"]
+STATUS_INDEX = {status: i for i, status in enumerate(STATUS_OPTIONS)}
+
+CALENDAR_OPTIONS = {
+    "headerToolbar": {"left": "prev,next today", "center": "title",
+                      "right": "dayGridMonth,timeGridWeek,timeGridDay"},
+    "height": "800px",
+}
+
 
 def sanitize_df_for_streamlit(df: pd.DataFrame) -> pd.DataFrame:
     df_copy = df.copy()
@@ -40,10 +49,12 @@ with main_col:
     df_filtered = calendar_df.dropna(subset=['due_date'])
 
     if not df_filtered.empty:
+        # Format every due date in one vectorized pass rather than calling strftime per row
+        due_date_strs = df_filtered['due_date'].dt.strftime('%Y-%m-%d')
         calendar_events = []
-        for _, row in df_filtered.iterrows():
+        for idx, row in df_filtered.iterrows():
             try:
-                date_str = row['due_date'].strftime('%Y-%m-%d')
+                date_str = due_date_strs.at[idx]
                 calendar_events.append({
                     "title": f"{row['priority']} - {row['task_description']}",
                     "start": date_str,
@@ -63,11 +74,7 @@ with main_col:
         if calendar_events:
             clicked_event = calendar(
                 events=calendar_events,
-                options={
-                    "headerToolbar": {"left": "prev,next today", "center": "title",
-                                      "right": "dayGridMonth,timeGridWeek,timeGridDay"},
-                    "height": "800px",
-                },
+                options=CALENDAR_OPTIONS,
                 key="calendar"
             )
 
@@ -84,7 +91,10 @@ with main_col:
         st.warning("No tasks with valid due dates were found.")
 
 # --- Details Pane Logic (now inside the side column) ---
-with details_col:
+# Runs as a fragment so picking a status or hiding the pane reruns only this column,
+# not the calendar and its event list.
+@st.fragment
+def render_details_pane():
     if st.session_state.selected_event_details:
         props = st.session_state.selected_event_details
         task_id = props.get('id', 'unknown')
@@ -98,17 +108,12 @@ with details_col:
 
             st.markdown(f"**Project:** `{props.get('project', 'N/A')}`")
 
-            status_options = ["To Do", "In Progress", "Done", "Blocked"]
             current_status = props.get('status', 'To Do')
-            try:
-                current_status_index = status_options.index(current_status)
-            except ValueError:
-                current_status_index = 0
 
             new_status = st.selectbox(
                 "**Status:**",
-                options=status_options,
-                index=current_status_index,
+                options=STATUS_OPTIONS,
+                index=STATUS_INDEX.get(current_status, 0),
                 key=f"status_selectbox_{task_id}"
             )
 
@@ -127,6 +132,10 @@ with details_col:
             with col2:
                 if st.button("Hide Details", key=f"hide_btn_{task_id}"):
                     st.session_state.selected_event_details = None
-                    st.rerun()
+                    st.rerun(scope="fragment")
     else:
-        st.info("Click an event on the calendar to see its details here.")
\ No newline at end of file
+        st.info("Click an event on the calendar to see its details here.")
+
+
+with details_col:
+    render_details_pane()
@@ -23,8 +23,8 @@ st.info(
 all_tasks_df = db_handler.get_all_action_items_as_df()
 
 if not all_tasks_df.empty:
-    # Create a list of task descriptions for the selectbox
-    task_options = all_tasks_df['task_description'].tolist()
+    # Create a list of unique task descriptions for the selectbox, keeping their order stable across reruns
+    task_options = list(dict.fromkeys(all_tasks_df['task_description'].dropna()))
     selected_task = st.selectbox("Select a task to break down:", task_options)
 
     if st.button("✨ Break Down Task", type="primary"):
@@ -53,7 +53,8 @@ if not all_tasks_df.empty:
                     if start_index != -1 and end_index != -1:
                         json_str = raw_response[start_index: end_index + 1].strip()
                         tasks = json.loads(json_str)
-                        st.session_state.tasks_to_review = tasks
+                        # Build the review frame once here; the editor below reuses it on every rerun
+                        st.session_state.tasks_to_review = pd.DataFrame(tasks)
                     else:
                         st.error("The AI returned an invalid response.")
 
@@ -66,11 +67,12 @@ else:
     st.warning("No tasks found in the database. Add some tasks first to use this feature.")
 
 # --- Review and Save Section ---
-if "tasks_to_review" in st.session_state and st.session_state.tasks_to_review:
+tasks_to_review = st.session_state.get("tasks_to_review")
+if tasks_to_review is not None and not tasks_to_review.empty:
     st.markdown("---")
     st.subheader("Review and Save Sub-Tasks")
     edited_tasks_df = st.data_editor(
-        pd.DataFrame(st.session_state.tasks_to_review),
+        tasks_to_review,
         num_rows="dynamic",
         key="review_editor"
     )
@@ -27,6 +27,12 @@ def sanitize_df_for_streamlit(df: pd.DataFrame) -> pd.DataFrame:
     return df_copy
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_cached_summary(_agent, tasks_json: str) -> str:
+    """Generates the weekly summary, reusing it while the upcoming tasks are unchanged."""
+    return _agent.get_prioritization(tasks_json, weekly_summary_prompt)
+
+
 # --- Page Content ---
 st.subheader("📈 AI-Powered Weekly Summary")
 st.info("Click the button below to generate a strategic summary of your tasks due in the next 7 days.")
@@ -59,7 +65,7 @@ if st.button("🚀 Generate Weekly Report", type="primary"):
             tasks_json = upcoming_tasks_df.to_json(orient="records")
 
             # Use the get_prioritization method, which is a simple, direct call to the model
-            summary = agent.get_prioritization(tasks_json, weekly_summary_prompt)
+            summary = get_cached_summary(agent, tasks_json)
 
             st.markdown("---")
             st.markdown(summary)
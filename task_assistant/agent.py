@@ -13,6 +13,10 @@ class Agent:
     def __init__(self, model):
         self.model = model
         self.parser = PydanticOutputParser(pydantic_object=TaskList)
+        # The schema never changes, so render its format instructions once rather than per call
+        self.format_instructions = self.parser.get_format_instructions()
+        # Prompt chains keyed by their system prompt, built on first use
+        self._chains = {}
 
     def get_structured_tasks(self, prompt_template: str, content: str) -> TaskList:
         """
@@ -21,17 +25,18 @@ class Agent:
         """
         current_date_str = datetime.now().strftime("%A, %Y-%m-%d")
 
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", prompt_template),
-            ("human", "{user_input}")
-        ])
-
-        chain = prompt | self.model
+        chain = self._chains.get(prompt_template)
+        if chain is None:
+            prompt = ChatPromptTemplate.from_messages([
+                ("system", prompt_template),
+                ("human", "{user_input}")
+            ])
+            chain = self._chains[prompt_template] = prompt | self.model
 
         log.info("Invoking LLM chain to get raw output...")
         try:
             raw_result = chain.invoke({
-                "format_instructions": self.parser.get_format_instructions(),
+                "format_instructions": self.format_instructions,
                 "current_date": current_date_str,
                 "user_input": content
             })
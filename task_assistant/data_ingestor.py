@@ -21,6 +21,12 @@ class DataIngestor:
         cursor.execute("SELECT id FROM source_documents WHERE content_hash = ?", (content_hash,))
         return cursor.fetchone() is not None
 
+    def source_exists(self, content: str) -> bool:
+        """
+        Checks whether a document with this exact content has already been ingested.
+        """
+        return self._check_source_exists(self._calculate_hash(content))
+
     def ingest_data(self, source_name: str, content: str, tasks: list[dict]):
         """
         Handles the end-to-end process of ingesting a new document and its tasks.
@@ -33,23 +39,25 @@ class DataIngestor:
         try:
             with self.conn:
                 cursor = self.conn.cursor()
-                processed_at = datetime.now()
+                now = datetime.now()
 
                 # 1. Insert into source_documents table
                 cursor.execute(
                     "INSERT INTO source_documents (source_name, content_hash, processed_at) VALUES (?, ?, ?)",
-                    (source_name, content_hash, processed_at)
+                    (source_name, content_hash, now)
                 )
                 source_document_id = cursor.lastrowid
 
-                # 2. Insert tasks into action_items table
-                created_at = datetime.now()
-                for task in tasks:
-                    task_json = json.dumps(task)
-                    cursor.execute(
-                        "INSERT INTO action_items (source_document_id, task_data, created_at) VALUES (?, ?, ?)",
-                        (source_document_id, task_json, created_at)
-                    )
+                # 2. Insert tasks into action_items table, stamped with the same time as the source.
+                # Compact separators drop the padding after each ',' and ':' for smaller rows
+                task_rows = [
+                    (source_document_id, json.dumps(task, separators=(',', ':')), now)
+                    for task in tasks
+                ]
+                cursor.executemany(
+                    "INSERT INTO action_items (source_document_id, task_data, created_at) VALUES (?, ?, ?)",
+                    task_rows
+                )
             log.info(f"SUCCESS: Inserted {len(tasks)} tasks into SQLite for source '{source_name}'.")
 
             # 3. Add the document content to the vector store
@@ -9,11 +9,19 @@ from .logger_config import log
 class DatabaseHandler:
     def __init__(self, db_name="task_master.db"):
         try:
-            self.conn = sqlite3.connect(db_name, check_same_thread=False)
+            # timeout=5.0 is sqlite3's default busy wait, written out so it reads alongside the pragmas
+            self.conn = sqlite3.connect(db_name, check_same_thread=False, timeout=5.0)
             self.conn.row_factory = sqlite3.Row
+            # WAL lets readers in other sessions proceed during a write, and NORMAL sync
+            # only fsyncs at checkpoints instead of on every commit.
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
         except sqlite3.Error as e:
             log.error(f"Database connection error: {e}")
             raise
+        # Cached (data version, DataFrame) pair for get_all_action_items_as_df
+        self._items_df_cache = None
+        self._generation = 0
         self._create_tables()
 
     def get_connection(self):
@@ -46,50 +54,101 @@ class DatabaseHandler:
         except sqlite3.Error as e:
             log.error(f"Error creating tables: {e}")
 
+    def get_data_version(self) -> tuple[int, int, int]:
+        """
+        Returns a token that changes whenever the stored data changes. Callers can
+        key their own caches on it.
+        """
+        # total_changes tracks writes made through this connection (the DataIngestor
+        # shares it), PRAGMA data_version tracks commits from other connections, and
+        # the generation counter covers dropped tables, which neither of them counts.
+        external_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return self._generation, self.conn.total_changes, external_version
+
     def get_all_action_items_as_df(self) -> pd.DataFrame:
-        query = "SELECT id, task_data, created_at, depends_on_id FROM action_items ORDER BY id DESC"
+        """
+        Returns all action items as a flat DataFrame. The parsed frame is cached
+        until the next write, so Streamlit reruns don't re-read the whole table.
+        """
+        version = self.get_data_version()
+        if self._items_df_cache is None or self._items_df_cache[0] != version:
+            self._items_df_cache = (version, self._load_action_items_df())
+        return self._items_df_cache[1].copy()
+
+    def _load_action_items_df(self) -> pd.DataFrame:
+        # Flatten the task_data JSON inside SQLite rather than json.loads-ing every row in Python.
+        # json_type is NULL only for a missing key, which mirrors dict.get() defaults; rows that
+        # SQLite can't treat as a JSON object go through _load_unflattened_rows instead.
+        query = """
+            SELECT
+                id,
+                CASE WHEN json_type(task_data, '$.task_description') IS NOT NULL
+                     THEN json_extract(task_data, '$.task_description')
+                     ELSE json_extract(task_data, '$.task') END AS task_description,
+                json_extract(task_data, '$.due_date') AS due_date,
+                json_extract(task_data, '$.project') AS project,
+                json_extract(task_data, '$.priority') AS priority,
+                CASE WHEN json_type(task_data, '$.status') IS NOT NULL
+                     THEN json_extract(task_data, '$.status')
+                     ELSE 'To Do' END AS status,
+                created_at,
+                depends_on_id
+            FROM action_items
+            WHERE json_valid(task_data) AND json_type(task_data) = 'object'
+            ORDER BY id DESC
+        """
 
         try:
-            rows = self.conn.execute(query).fetchall()
+            cursor = self.conn.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(query).fetchall()
+            fallback_rows = self._load_unflattened_rows(cursor)
         except sqlite3.OperationalError:
             return self.get_empty_df()
 
-        if not rows:
-            return self.get_empty_df()
+        if fallback_rows:
+            rows = sorted(rows + fallback_rows, key=lambda row: row[0], reverse=True)
 
-        data_list = []
-        for row in rows:
-            try:
-                task_data = json.loads(row['task_data'])
-                flat_record = {
-                    'id': row['id'],
-                    'created_at': row['created_at'],
-                    'task_description': task_data.get('task_description', task_data.get('task')),
-                    'due_date': task_data.get('due_date'),
-                    'project': task_data.get('project'),
-                    'priority': task_data.get('priority'),
-                    'status': task_data.get('status', 'To Do'),
-                    'depends_on_id': row['depends_on_id']
-                }
-                data_list.append(flat_record)
-            except (json.JSONDecodeError, TypeError) as e:
-                log.error(f"Could not parse JSON for row ID {row.get('id', 'N/A')}: {e}")
-                continue
-
-        if not data_list:
+        if not rows:
             return self.get_empty_df()
 
         expected_cols = [
             'id', 'task_description', 'due_date', 'project',
             'priority', 'status', 'created_at', 'depends_on_id'
         ]
-        df = pd.DataFrame.from_records(data_list, columns=expected_cols)
+        df = pd.DataFrame.from_records(rows, columns=expected_cols)
 
         df['created_at'] = pd.to_datetime(df['created_at'], errors='coerce')
         df['due_date'] = pd.to_datetime(df['due_date'], errors='coerce')
 
         return df
 
+    def _load_unflattened_rows(self, cursor) -> list[tuple]:
+        # SQLite's json_valid is stricter than json.loads: it rejects the NaN values older
+        # Jira imports wrote. Parse the rows the query above skipped in Python, as before.
+        cursor.execute("""
+            SELECT id, task_data, created_at, depends_on_id
+            FROM action_items
+            WHERE NOT (json_valid(task_data) AND json_type(task_data) = 'object')
+        """)
+        records = []
+        for item_id, task_data, created_at, depends_on_id in cursor.fetchall():
+            try:
+                task_data = json.loads(task_data)
+                records.append((
+                    item_id,
+                    task_data.get('task_description', task_data.get('task')),
+                    task_data.get('due_date'),
+                    task_data.get('project'),
+                    task_data.get('priority'),
+                    task_data.get('status', 'To Do'),
+                    created_at,
+                    depends_on_id
+                ))
+            except (json.JSONDecodeError, TypeError, AttributeError) as e:
+                log.error(f"Could not parse JSON for row ID {item_id}: {e}")
+        return records
+
     def get_empty_df(self) -> pd.DataFrame:
         columns = [
             'id', 'task_description', 'due_date', 'project',
@@ -98,30 +157,62 @@ class DatabaseHandler:
         return pd.DataFrame(columns=columns)
 
     def update_action_item(self, item_id: int, updates: dict):
-        task_data_updates = {k: v for k, v in updates.items() if k != 'depends_on_id'}
-        dependency_update = updates.get('depends_on_id')
         try:
             with self.conn:
-                cursor = self.conn.cursor()
-                if dependency_update is not None:
-                    cursor.execute("UPDATE action_items SET depends_on_id = ? WHERE id = ?",
-                                   (dependency_update, item_id))
-
-                if task_data_updates:
-                    cursor.execute("SELECT task_data FROM action_items WHERE id = ?", (item_id,))
-                    result = cursor.fetchone()
-                    if not result: return
-                    current_task_data = json.loads(result['task_data'])
-                    for key, value in task_data_updates.items():
-                        if isinstance(value, (pd.Timestamp, date)):
-                            current_task_data[key] = value.strftime('%Y-%m-%d')
-                        else:
-                            current_task_data[key] = value
-                    updated_task_json = json.dumps(current_task_data)
-                    cursor.execute("UPDATE action_items SET task_data = ? WHERE id = ?", (updated_task_json, item_id))
+                self._write_updates(self.conn.cursor(), {item_id: updates})
         except sqlite3.Error as e:
             log.error(f"DB ERROR during update for ID {item_id}: {e}")
 
+    def update_action_items(self, updates_by_id: dict[int, dict]):
+        """
+        Applies updates to several action items in a single transaction.
+
+        Args:
+            updates_by_id: A mapping of action item ID to the fields to update.
+        """
+        if not updates_by_id: return
+        try:
+            with self.conn:
+                self._write_updates(self.conn.cursor(), updates_by_id)
+        except sqlite3.Error as e:
+            log.error(f"DB ERROR during batch update of {len(updates_by_id)} item(s): {e}")
+
+    def _write_updates(self, cursor, updates_by_id: dict[int, dict]):
+        dependency_rows = []
+        task_data_updates_by_id = {}
+        for item_id, updates in updates_by_id.items():
+            # IDs often come out of DataFrames as numpy ints, which sqlite3 would bind as blobs
+            item_id = int(item_id)
+            if updates.get('depends_on_id') is not None:
+                dependency_rows.append((int(updates['depends_on_id']), item_id))
+            task_data_updates = {k: v for k, v in updates.items() if k != 'depends_on_id'}
+            if task_data_updates:
+                task_data_updates_by_id[item_id] = task_data_updates
+
+        if dependency_rows:
+            cursor.executemany("UPDATE action_items SET depends_on_id = ? WHERE id = ?", dependency_rows)
+
+        if not task_data_updates_by_id:
+            return
+
+        # Fetch every affected task_data blob in one query and index it by ID
+        item_ids = list(task_data_updates_by_id)
+        placeholders = ", ".join("?" for _ in item_ids)
+        cursor.execute(f"SELECT id, task_data FROM action_items WHERE id IN ({placeholders})", item_ids)
+        current_by_id = {row['id']: json.loads(row['task_data']) for row in cursor.fetchall()}
+
+        task_data_rows = []
+        for item_id, task_data_updates in task_data_updates_by_id.items():
+            current_task_data = current_by_id.get(item_id)
+            if current_task_data is None: continue
+            for key, value in task_data_updates.items():
+                if isinstance(value, (pd.Timestamp, date)):
+                    current_task_data[key] = value.strftime('%Y-%m-%d')
+                else:
+                    current_task_data[key] = value
+            task_data_rows.append((json.dumps(current_task_data, separators=(',', ':')), item_id))
+        cursor.executemany("UPDATE action_items SET task_data = ? WHERE id = ?", task_data_rows)
+
     def delete_action_items(self, item_ids: list[int]):
         if not item_ids: return
         safe_item_ids = [int(i) for i in item_ids]
@@ -138,6 +229,7 @@ class DatabaseHandler:
             with self.conn:
                 self.conn.execute("DROP TABLE IF EXISTS action_items")
                 self.conn.execute("DROP TABLE IF EXISTS source_documents")
+            self._generation += 1
             self._create_tables()
         except sqlite3.Error as e:
             log.error(f"Failed to drop tables: {e}")
\ No newline at end of file
@@ -1,6 +1,4 @@
 import os
-import docx
-from pypdf import PdfReader
 from .logger_config import log
 
 
@@ -12,17 +10,16 @@ def read_txt(file_path: str) -> str:
 
 def read_docx(file_path: str) -> str:
     """Reads text from a .docx file."""
+    import docx  # Imported on demand so .txt and .pdf reads don't pay for it
     doc = docx.Document(file_path)
     return "\n".join([para.text for para in doc.paragraphs])
 
 
 def read_pdf(file_path: str) -> str:
     """Reads text from a .pdf file."""
+    from pypdf import PdfReader
     reader = PdfReader(file_path)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() or ""
-    return text
+    return "".join(page.extract_text() or "" for page in reader.pages)
 
 
 def read_file(file_path: str) -> str:
@@ -3,15 +3,23 @@ import pandas as pd
 import os
 from .logger_config import log
 
+# The only Jira export columns the importer reads
+JIRA_COLUMNS = {"Assignee", "Summary", "Project name", "Due date", "Status"}
 
-def process_jira_csv(file_path: str) -> list[dict]:
+
+def process_jira_csv(source) -> list[dict]:
     """
     Reads a Jira CSV export, filters for tasks assigned to the user,
     and maps the columns to our application's task format.
+
+    Args:
+        source: A path to the CSV file or a file-like object holding its bytes.
     """
     try:
-        df = pd.read_csv(file_path)
-        log.info(f"Successfully loaded Jira CSV from {file_path}")
+        # Jira exports carry dozens of columns; parse only the ones we map, as plain strings,
+        # so pandas skips type inference on the rest.
+        df = pd.read_csv(source, usecols=lambda col: col in JIRA_COLUMNS, dtype=str)
+        log.info("Successfully loaded Jira CSV export.")
     except Exception as e:
         log.error(f"Failed to read CSV file: {e}")
         return []
@@ -32,19 +40,27 @@ def process_jira_csv(file_path: str) -> list[dict]:
         "blocked": "Blocked",
     }
 
-    tasks = []
-    for _, row in user_tasks_df.iterrows():
-        # MODIFIED: Changed strftime format to YYYY-MM-DD for consistency
-        due_date = pd.to_datetime(row.get('Due date')).strftime('%Y-%m-%d') if pd.notna(row.get('Due date')) else None
+    # Build each output column in one vectorized pass rather than row by row.
+    # Columns missing from the export come back as all-NaN, like row.get() defaults.
+    user_tasks_df = user_tasks_df.reindex(columns=list(JIRA_COLUMNS)).astype(object)
 
-        jira_status = row.get('Status', '').lower()
-        app_status = status_mapping.get(jira_status, "To Do")
+    # format="mixed" parses each value on its own, as the old per-row loop did, instead of
+    # inferring one format from the first value and coercing every other format to NaT.
+    parsed_due_dates = pd.to_datetime(user_tasks_df['Due date'], format="mixed", errors='coerce')
+    unparsed_count = int((user_tasks_df['Due date'].notna() & parsed_due_dates.isna()).sum())
+    if unparsed_count:
+        log.warning(f"Could not parse {unparsed_count} Jira due date(s); those tasks were imported without one.")
+    # MODIFIED: Changed strftime format to YYYY-MM-DD for consistency
+    due_dates = parsed_due_dates.dt.strftime('%Y-%m-%d')
+    statuses = user_tasks_df['Status'].str.lower().map(status_mapping).fillna("To Do")
 
-        tasks.append({
-            "task": row.get('Summary'),
-            "project": row.get('Project name'),
-            "due_date": due_date,
-            "status": app_status,
-        })
+    tasks_df = pd.DataFrame({
+        "task": user_tasks_df['Summary'],
+        "project": user_tasks_df['Project name'],
+        "due_date": due_dates,
+        "status": statuses,
+    })
+    # Blank cells become None so they serialize as JSON null rather than NaN
+    tasks_df = tasks_df.astype(object).where(tasks_df.notna(), None)
 
-    return tasks
\ No newline at end of file
+    return tasks_df.to_dict('records')
@@ -1,3 +1,4 @@
+import re
 import yaml
 from .logger_config import log
 
@@ -15,6 +16,15 @@ class RulesEngine:
             log.error(f"Error loading configuration file: {e}")
             self.rules = {}
 
+        # One compiled alternation per rule, so matching a task is a single regex
+        # scan per rule instead of a substring search per keyword.
+        # A rule without keywords never matches, as with any() over an empty list.
+        self._priority_patterns = [
+            (re.compile("|".join(re.escape(keyword) for keyword in rule["keywords"])), rule["priority"])
+            for rule in (self.rules or {}).get("priority_rules") or []
+            if rule.get("keywords")
+        ]
+
     def apply_priority(self, tasks: list[dict]) -> list[dict]:
         """
         Applies priority to tasks based on keywords in the task description.
@@ -28,15 +38,13 @@ class RulesEngine:
         if "priority_rules" not in self.rules:
             return tasks
 
-        priority_rules = self.rules["priority_rules"]
-
         for task in tasks:
             task['priority'] = "⚪ Normal"  # Default priority
             task_description = task.get("task", "").lower()
 
-            for rule in priority_rules:
-                if any(keyword in task_description for keyword in rule["keywords"]):
-                    task['priority'] = rule["priority"]
+            for pattern, priority in self._priority_patterns:
+                if pattern.search(task_description):
+                    task['priority'] = priority
                     break  # Stop at the first rule that matches
 
         return tasks
\ No newline at end of file
@@ -7,8 +7,6 @@ from .vector_store_handler import VectorStoreHandler
 from .agent import Agent
 from .rules_engine import RulesEngine
 from .data_ingestor import DataIngestor  # Import the new DataIngestor
-from langchain_ollama.chat_models import ChatOllama
-from sentence_transformers import SentenceTransformer
 
 
 # --- Cached Resources ---
@@ -16,6 +14,8 @@ from sentence_transformers import SentenceTransformer
 @st.cache_resource
 def load_embedding_model(model_name='all-MiniLM-L6-v2'):
     """Loads and caches the sentence transformer model."""
+    # Imported here so pulling in this module doesn't load torch until the model is needed
+    from sentence_transformers import SentenceTransformer
     log.info(f"Loading sentence transformer model '{model_name}'...")
     model = SentenceTransformer(model_name)
     log.info("Sentence transformer model loaded.")
@@ -25,12 +25,35 @@ def load_embedding_model(model_name='all-MiniLM-L6-v2'):
 @st.cache_resource
 def load_llm_model(model_name="mistral"):
     """Loads and caches the main Language Model."""
+    from langchain_ollama.chat_models import ChatOllama
     log.info(f"Loading LLM '{model_name}'...")
     model = ChatOllama(model=model_name)
     log.info("LLM loaded.")
     return model
 
 
+@st.cache_resource
+def load_vector_store(_embedding_model):
+    """
+    Loads the FAISS index once and shares it across sessions, so every session
+    searches the same index and one session's save can't drop another's documents.
+    """
+    return VectorStoreHandler(model=_embedding_model)
+
+
+@st.cache_resource
+def load_rules_engine(config_path="config.yaml", config_mtime=None):
+    """
+    Parses the rules config once and shares the engine across sessions. The file's
+    modification time is part of the cache key, so editing config.yaml invalidates it.
+    """
+    return RulesEngine(config_path)
+
+
+def _get_config_mtime(config_path="config.yaml"):
+    return os.path.getmtime(config_path) if os.path.exists(config_path) else None
+
+
 # --- Main Initialization Function ---
 
 def initialize_services():
@@ -45,7 +68,7 @@ def initialize_services():
 
         # Initialize handlers that don't depend on others
         db_handler = DatabaseHandler()
-        vector_store = VectorStoreHandler(model=embedding_model)
+        vector_store = load_vector_store(embedding_model)
 
         # THE FIX: Initialize the DataIngestor with the required connections
         data_ingestor = DataIngestor(
@@ -58,7 +81,7 @@ def initialize_services():
         st.session_state.vector_store = vector_store
         st.session_state.data_ingestor = data_ingestor  # Store the new ingestor
         st.session_state.agent = Agent(model=llm)
-        st.session_state.rules_engine = RulesEngine()
+        st.session_state.rules_engine = load_rules_engine(config_mtime=_get_config_mtime())
 
         st.session_state.services_initialized = True
         log.info("--- All services initialized successfully ---")
\ No newline at end of file
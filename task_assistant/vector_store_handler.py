@@ -1,8 +1,8 @@
 # task_assistant/vector_store_handler.py
 import os
+import threading
 import faiss
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from .logger_config import log
 import pickle
 
@@ -19,6 +19,8 @@ class VectorStoreHandler:
         self.dimension = self.model.get_sentence_embedding_dimension()
         self.doc_id_map = {}
         self.next_id = 0
+        # The handler is shared across Streamlit sessions, which run on separate threads
+        self._lock = threading.Lock()
 
         self.load_index()
 
@@ -29,26 +31,43 @@ class VectorStoreHandler:
             self.index = faiss.read_index(self.index_path)
             with open(self.mapping_path, 'rb') as f:
                 self.doc_id_map = pickle.load(f)
-            self.next_id = max(self.doc_id_map.keys()) + 1 if self.doc_id_map else 0
+            # Index positions are the document IDs, so continue numbering from the index itself.
+            # After a crash between save_index's two swaps the index can be one save ahead of the
+            # mapping; its unmapped vectors are skipped by search and new IDs stay aligned.
+            self.next_id = self.index.ntotal
         else:
             log.info("No existing index found. Creating a new one.")
             self.index = faiss.IndexFlatL2(self.dimension)
 
     def save_index(self):
         log.info(f"Saving FAISS index to {self.index_path}")
-        faiss.write_index(self.index, self.index_path)
-        with open(self.mapping_path, 'wb') as f:
-            pickle.dump(self.doc_id_map, f)
+        # Write to temporary files and swap them in, so a crash mid-save can't leave a
+        # truncated file. The mapping is swapped in last; load_index copes with an index
+        # that is ahead of its mapping.
+        tmp_index_path = f"{self.index_path}.tmp"
+        tmp_mapping_path = f"{self.mapping_path}.tmp"
+        try:
+            faiss.write_index(self.index, tmp_index_path)
+            with open(tmp_mapping_path, 'wb') as f:
+                pickle.dump(self.doc_id_map, f)
+        except Exception:
+            for tmp_path in (tmp_index_path, tmp_mapping_path):
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            raise
+        os.replace(tmp_index_path, self.index_path)
+        os.replace(tmp_mapping_path, self.mapping_path)
 
     def add_document(self, text: str):
         try:
             embedding = self.model.encode([text])
             if embedding.ndim == 1:
                 embedding = np.expand_dims(embedding, axis=0)
-            self.index.add(embedding)
-            self.doc_id_map[self.next_id] = text
-            self.next_id += 1
-            self.save_index()
+            with self._lock:
+                self.index.add(embedding)
+                self.doc_id_map[self.next_id] = text
+                self.next_id += 1
+                self.save_index()
             log.info("Successfully added a new document to the vector store.")
         except Exception as e:
             log.error(f"Failed to add document to vector store: {e}", exc_info=True)
@@ -60,7 +79,8 @@ class VectorStoreHandler:
             query_embedding = self.model.encode([query])
             if query_embedding.ndim == 1:
                 query_embedding = np.expand_dims(query_embedding, axis=0)
-            distances, indices = self.index.search(query_embedding, k)
+            with self._lock:
+                distances, indices = self.index.search(query_embedding, k)
             results = [self.doc_id_map[i] for i in indices[0] if i in self.doc_id_map]
             log.info(f"Vector search for query '{query}' returned {len(results)} results.")
             return results
@@ -34,50 +34,49 @@ def sanitize_df_for_streamlit(df: pd.DataFrame) -> pd.DataFrame:
     return df_copy
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_cached_prioritization(_agent, tasks_json: str) -> str:
+    """Asks the LLM for a prioritization, reusing the answer while the active tasks are unchanged."""
+    return _agent.get_prioritization(tasks_json, prioritization_prompt)
+
+
 # --- Main Page Content ---
 st.title("📊 Task Dashboard")
 st.markdown("Your AI-Powered Action Item Extractor and Planner.")
 
+# --- Data Loading ---
+# Load and sanitize the tasks once per rerun; both the AI suggestion and the dashboard reuse this frame.
+full_df = db_handler.get_all_action_items_as_df()
+if not full_df.empty:
+    full_df = sanitize_df_for_streamlit(full_df)
+
 st.markdown("---")
 if st.button("🤖 What should I do next?", type="primary"):
     with st.spinner("AI is thinking..."):
-        all_tasks_df = db_handler.get_all_action_items_as_df()
-
-        if not all_tasks_df.empty:
-            all_tasks_df = sanitize_df_for_streamlit(all_tasks_df)
-            active_tasks_df = all_tasks_df[all_tasks_df['status'] != 'Done']
+        if not full_df.empty:
+            active_tasks_df = full_df[full_df['status'] != 'Done']
             if not active_tasks_df.empty:
                 tasks_json = active_tasks_df.to_json(orient="records")
-                suggestion = abot.get_prioritization(tasks_json, prioritization_prompt)
+                suggestion = get_cached_prioritization(abot, tasks_json)
                 st.info(suggestion)
             else:
                 st.warning("You have no active tasks to prioritize. Great job!")
         else:
             st.warning("No tasks found in the database to prioritize.")
 
-# --- Data Loading and Processing ---
-full_df = db_handler.get_all_action_items_as_df()
-
 if full_df.empty:
     st.info("👋 Welcome! Your task dashboard is ready. Add some tasks from the sidebar pages to get started.")
     st.stop()
 
 try:
-    full_df = sanitize_df_for_streamlit(full_df)
-
-    if 'status' in full_df.columns:
-        active_tasks_df = full_df[full_df['status'] != 'Done'].copy()
-    else:
-        active_tasks_df = pd.DataFrame()
-
-    # THIS IS THE FIX: First, create a temporary DataFrame that only includes tasks with a valid due date.
-    tasks_with_due_dates = active_tasks_df.dropna(subset=['due_date'])
-
     today = pd.to_datetime(datetime.now().date())
 
-    # Now, perform the date comparisons on the clean, filtered data.
-    overdue_tasks = tasks_with_due_dates[tasks_with_due_dates['due_date'] < today]
-    due_today_tasks = tasks_with_due_dates[tasks_with_due_dates['due_date'] == today]
+    # Build each view from boolean masks over the one frame. NaT compares False,
+    # so tasks without a due date drop out of the date masks on their own.
+    active_mask = full_df['status'] != 'Done'
+    active_tasks_df = full_df[active_mask]
+    overdue_tasks = full_df[active_mask & (full_df['due_date'] < today)]
+    due_today_tasks = full_df[active_mask & (full_df['due_date'] == today)]
 
     # --- Dashboard Metrics ---
     st.markdown("---")
@@ -93,16 +92,19 @@ try:
     with list_col1:
         with st.expander(f"**🔴 Overdue Tasks ({len(overdue_tasks)})**", expanded=True):
             if not overdue_tasks.empty:
-                for _, row in overdue_tasks.iterrows():
-                    st.markdown(f"- **{row['task_description']}** (Due: {row['due_date'].strftime('%Y-%m-%d')})")
+                # One markdown element for the whole list rather than one per task
+                overdue_lines = ("- **" + overdue_tasks['task_description'].astype(str) + "** (Due: "
+                                 + overdue_tasks['due_date'].dt.strftime('%Y-%m-%d') + ")")
+                st.markdown("\n".join(overdue_lines))
             else:
                 st.write("No overdue tasks. Great job!")
 
     with list_col2:
         with st.expander(f"**🟠 Tasks Due Today ({len(due_today_tasks)})**", expanded=True):
             if not due_today_tasks.empty:
-                for _, row in due_today_tasks.iterrows():
-                    st.markdown(f"- **{row['task_description']}** (Project: {row['project']})")
+                due_today_lines = ("- **" + due_today_tasks['task_description'].astype(str) + "** (Project: "
+                                   + due_today_tasks['project'].astype(str) + ")")
+                st.markdown("\n".join(due_today_lines))
             else:
                 st.write("No tasks due today.")
 